@@ -19,10 +19,19 @@ HEIGHT = 400
 BALL_RADIUS = 20
 PAD_WIDTH = 8
 PAD_HEIGHT = 80
+FPS = 60
 HALF_PAD_WIDTH = PAD_WIDTH / 2
 HALF_PAD_HEIGHT = PAD_HEIGHT / 2
-ball_pos = [0,0]
-ball_vel = [0,0]
+PADDLE1_X = HALF_PAD_WIDTH - 1
+PADDLE2_X = WIDTH + 1 - HALF_PAD_WIDTH
+PAD_MIN_Y = HALF_PAD_HEIGHT
+PAD_MAX_Y = HEIGHT - HALF_PAD_HEIGHT
+ball_x = 0
+ball_y = 0
+ball_vx = 0
+ball_vy = 0
+paddle1_y = 0
+paddle2_y = 0
 paddle1_vel = 0
 paddle2_vel = 0
 l_score = 0
@@ -32,25 +41,57 @@ r_score = 0
 window = pygame.display.set_mode((WIDTH, HEIGHT), 0, 32)
 pygame.display.set_caption('Hello World')
 
-# helper function that spawns a ball, returns a position vector and a velocity vector
+#score font is looked up once instead of every frame
+score_font = pygame.font.SysFont("Comic Sans MS", 20)
+score_labels = {}
+
+# helper function that returns the rendered label for a score, rendering it only the first time
+def score_label(score):
+    label = score_labels.get(score)
+    if label is None:
+        label = score_font.render("Score "+str(score), 1, (255,255,0))
+        score_labels[score] = label
+    return label
+
+#static background (field lines and centre circle), drawn once
+background = pygame.Surface((WIDTH, HEIGHT)).convert()
+background.fill(BLACK)
+pygame.draw.line(background, WHITE, [WIDTH / 2, 0],[WIDTH / 2, HEIGHT], 1)
+pygame.draw.line(background, WHITE, [PAD_WIDTH, 0],[PAD_WIDTH, HEIGHT], 1)
+pygame.draw.line(background, WHITE, [WIDTH - PAD_WIDTH, 0],[WIDTH - PAD_WIDTH, HEIGHT], 1)
+pygame.draw.circle(background, WHITE, [WIDTH//2, HEIGHT//2], 70, 1)
+
+#ball sprite, drawn once and blitted every frame
+ball_surf = pygame.Surface((2 * BALL_RADIUS, 2 * BALL_RADIUS), SRCALPHA)
+pygame.draw.circle(ball_surf, RED, [BALL_RADIUS, BALL_RADIUS], BALL_RADIUS, 0)
+ball_surf = ball_surf.convert_alpha()
+
+#paddle sprite, shared by both paddles
+#one pixel larger than the pad size, a filled polygon covers its edge pixels too
+paddle_surf = pygame.Surface((PAD_WIDTH + 1, PAD_HEIGHT + 1)).convert()
+paddle_surf.fill(GREEN)
+
+# helper function that spawns a ball, sets its position and velocity
 # if right is True, spawn to the right, else spawn to the left
 def ball_init(right):
-    global ball_pos, ball_vel # these are vectors stored as lists
-    ball_pos = [WIDTH/2,HEIGHT/2]
+    global ball_x, ball_y, ball_vx, ball_vy # plain scalars, position is always whole pixels
+    ball_x = WIDTH//2
+    ball_y = HEIGHT//2
     horz = random.randrange(2,4)
     vert = random.randrange(1,3)
     
     if right == False:
         horz = - horz
         
-    ball_vel = [horz,-vert]
+    ball_vx = horz
+    ball_vy = -vert
 
 # define event handlers
 def init():
-    global paddle1_pos, paddle2_pos, paddle1_vel, paddle2_vel,l_score,r_score  # these are floats
+    global paddle1_y, paddle2_y, paddle1_vel, paddle2_vel,l_score,r_score  # these are floats
     global score1, score2  # these are ints
-    paddle1_pos = [HALF_PAD_WIDTH - 1,HEIGHT/2]
-    paddle2_pos = [WIDTH +1 - HALF_PAD_WIDTH,HEIGHT/2]
+    paddle1_y = HEIGHT/2
+    paddle2_y = HEIGHT/2
     l_score = 0
     r_score = 0
     if random.randrange(0,2) == 0:
@@ -59,71 +100,56 @@ def init():
         ball_init(False)
 
 
-#draw function of canvas
-def draw(canvas):
-    global paddle1_pos, paddle2_pos, ball_pos, ball_vel, l_score, r_score
-           
-    canvas.fill(BLACK)
-    pygame.draw.line(canvas, WHITE, [WIDTH / 2, 0],[WIDTH / 2, HEIGHT], 1)
-    pygame.draw.line(canvas, WHITE, [PAD_WIDTH, 0],[PAD_WIDTH, HEIGHT], 1)
-    pygame.draw.line(canvas, WHITE, [WIDTH - PAD_WIDTH, 0],[WIDTH - PAD_WIDTH, HEIGHT], 1)
-    pygame.draw.circle(canvas, WHITE, [WIDTH//2, HEIGHT//2], 70, 1)
+#physics step, runs once per frame before drawing
+def update():
+    global paddle1_y, paddle2_y, ball_x, ball_y, ball_vx, ball_vy, l_score, r_score
 
     # update paddle's vertical position, keep paddle on the screen
-    if paddle1_pos[1] > HALF_PAD_HEIGHT and paddle1_pos[1] < HEIGHT - HALF_PAD_HEIGHT:
-        paddle1_pos[1] += paddle1_vel
-    elif paddle1_pos[1] == HALF_PAD_HEIGHT and paddle1_vel > 0:
-        paddle1_pos[1] += paddle1_vel
-    elif paddle1_pos[1] == HEIGHT - HALF_PAD_HEIGHT and paddle1_vel < 0:
-        paddle1_pos[1] += paddle1_vel
-    
-    if paddle2_pos[1] > HALF_PAD_HEIGHT and paddle2_pos[1] < HEIGHT - HALF_PAD_HEIGHT:
-        paddle2_pos[1] += paddle2_vel
-    elif paddle2_pos[1] == HALF_PAD_HEIGHT and paddle2_vel > 0:
-        paddle2_pos[1] += paddle2_vel
-    elif paddle2_pos[1] == HEIGHT - HALF_PAD_HEIGHT and paddle2_vel < 0:
-        paddle2_pos[1] += paddle2_vel
+    paddle1_y += paddle1_vel
+    paddle1_y = PAD_MIN_Y if paddle1_y < PAD_MIN_Y else PAD_MAX_Y if paddle1_y > PAD_MAX_Y else paddle1_y
 
-    #update ball
-    ball_pos[0] += int(ball_vel[0])
-    ball_pos[1] += int(ball_vel[1])
+    paddle2_y += paddle2_vel
+    paddle2_y = PAD_MIN_Y if paddle2_y < PAD_MIN_Y else PAD_MAX_Y if paddle2_y > PAD_MAX_Y else paddle2_y
 
-    #draw paddles and ball
-    pygame.draw.circle(canvas, RED, ball_pos, 20, 0)
-    pygame.draw.polygon(canvas, GREEN, [[paddle1_pos[0] - HALF_PAD_WIDTH, paddle1_pos[1] - HALF_PAD_HEIGHT], [paddle1_pos[0] - HALF_PAD_WIDTH, paddle1_pos[1] + HALF_PAD_HEIGHT], [paddle1_pos[0] + HALF_PAD_WIDTH, paddle1_pos[1] + HALF_PAD_HEIGHT], [paddle1_pos[0] + HALF_PAD_WIDTH, paddle1_pos[1] - HALF_PAD_HEIGHT]], 0)
-    pygame.draw.polygon(canvas, GREEN, [[paddle2_pos[0] - HALF_PAD_WIDTH, paddle2_pos[1] - HALF_PAD_HEIGHT], [paddle2_pos[0] - HALF_PAD_WIDTH, paddle2_pos[1] + HALF_PAD_HEIGHT], [paddle2_pos[0] + HALF_PAD_WIDTH, paddle2_pos[1] + HALF_PAD_HEIGHT], [paddle2_pos[0] + HALF_PAD_WIDTH, paddle2_pos[1] - HALF_PAD_HEIGHT]], 0)
+    #update ball
+    ball_x += int(ball_vx)
+    ball_y += int(ball_vy)
 
     #ball collision check on top and bottom walls
-    if int(ball_pos[1]) <= BALL_RADIUS:
-        ball_vel[1] = - ball_vel[1]
-    if int(ball_pos[1]) >= HEIGHT + 1 - BALL_RADIUS:
-        ball_vel[1] = -ball_vel[1]
+    if ball_y <= BALL_RADIUS:
+        ball_vy = - ball_vy
+    if ball_y >= HEIGHT + 1 - BALL_RADIUS:
+        ball_vy = -ball_vy
     
     #ball collison check on gutters or paddles
-    if int(ball_pos[0]) <= BALL_RADIUS + PAD_WIDTH and int(ball_pos[1]) in range(paddle1_pos[1] - HALF_PAD_HEIGHT,paddle1_pos[1] + HALF_PAD_HEIGHT,1):
-        ball_vel[0] = -ball_vel[0]
-        ball_vel[0] *= 1.1
-        ball_vel[1] *= 1.1
-    elif int(ball_pos[0]) <= BALL_RADIUS + PAD_WIDTH:
+    if ball_x <= BALL_RADIUS + PAD_WIDTH and paddle1_y - HALF_PAD_HEIGHT <= ball_y < paddle1_y + HALF_PAD_HEIGHT:
+        ball_vx = -ball_vx
+        ball_vx *= 1.1
+        ball_vy *= 1.1
+    elif ball_x <= BALL_RADIUS + PAD_WIDTH:
         r_score += 1
         ball_init(True)
         
-    if int(ball_pos[0]) >= WIDTH + 1 - BALL_RADIUS - PAD_WIDTH and int(ball_pos[1]) in range(paddle2_pos[1] - HALF_PAD_HEIGHT,paddle2_pos[1] + HALF_PAD_HEIGHT,1):
-        ball_vel[0] = -ball_vel[0]
-        ball_vel[0] *= 1.1
-        ball_vel[1] *= 1.1
-    elif int(ball_pos[0]) >= WIDTH + 1 - BALL_RADIUS - PAD_WIDTH:
+    if ball_x >= WIDTH + 1 - BALL_RADIUS - PAD_WIDTH and paddle2_y - HALF_PAD_HEIGHT <= ball_y < paddle2_y + HALF_PAD_HEIGHT:
+        ball_vx = -ball_vx
+        ball_vx *= 1.1
+        ball_vy *= 1.1
+    elif ball_x >= WIDTH + 1 - BALL_RADIUS - PAD_WIDTH:
         l_score += 1
         ball_init(False)
 
-    #update scores
-    myfont1 = pygame.font.SysFont("Comic Sans MS", 20)
-    label1 = myfont1.render("Score "+str(l_score), 1, (255,255,0))
-    canvas.blit(label1, (50,20))
 
-    myfont2 = pygame.font.SysFont("Comic Sans MS", 20)
-    label2 = myfont2.render("Score "+str(r_score), 1, (255,255,0))
-    canvas.blit(label2, (470, 20))  
+#draw function of canvas
+def draw(canvas):
+    canvas.blit(background, (0, 0))
+
+    #draw paddles and ball
+    canvas.blit(ball_surf, (ball_x - BALL_RADIUS, ball_y - BALL_RADIUS))
+    canvas.blit(paddle_surf, (PADDLE1_X - HALF_PAD_WIDTH, paddle1_y - HALF_PAD_HEIGHT))
+    canvas.blit(paddle_surf, (PADDLE2_X - HALF_PAD_WIDTH, paddle2_y - HALF_PAD_HEIGHT))
+
+    #update scores
+    canvas.blits(((score_label(l_score), (50,20)), (score_label(r_score), (470, 20))), 0)
     
     
 #keydown handler
@@ -148,23 +174,34 @@ def keyup(event):
     elif event.key in (K_UP, K_DOWN):
         paddle2_vel = 0
 
+#quit handler
+def quit_game(event):
+    pygame.quit()
+    sys.exit()
+
+event_handlers = {KEYDOWN: keydown, KEYUP: keyup, QUIT: quit_game}
+event_types = list(event_handlers)
+
+#only the handled event types ever enter the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(event_types)
+
 init()
 
 
 #game loop
 while True:
 
-    draw(window)
+    for event in pygame.event.get(event_types):
+        event_handlers[event.type](event)
 
-    for event in pygame.event.get():
+    #window minimized or hidden: skip physics and drawing, poll events slowly
+    if not pygame.display.get_active():
+        pygame.time.wait(50)
+        continue
+
+    update()
+    draw(window)
 
-        if event.type == KEYDOWN:
-            keydown(event)
-        elif event.type == KEYUP:
-            keyup(event)
-        elif event.type == QUIT:
-            pygame.quit()
-            sys.exit()
-            
     pygame.display.update()
-    fps.tick(60)
+    fps.tick(FPS)